@@ -5,6 +5,144 @@ from tkinter import Canvas, Event, IntVar, Tk
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this face count the threading overhead of the parallel kernel outweighs
+# the per-face work, so the serial kernels are used
+_PARALLEL_THRESHOLD = 1024
+
+
+def _face_batch(vertices: np.ndarray, faces: np.ndarray, cos_out: np.ndarray,
+                zc_out: np.ndarray, edges: np.ndarray = None,
+                normals: np.ndarray = None) -> None:
+    """
+    Compute the per-face shading and depth quantities as a batch of NumPy
+    operations. Fallback for `_face_kernel` when `numba` is not installed.
+
+    Args:
+        vertices (np.ndarray): (V, 3) array of vertex coordinates
+        faces (np.ndarray): (F, K) int32 array of vertex indices per face
+        cos_out (np.ndarray): (F,) output, signed cosine of the angle between the
+        surface normal of each face and the z-axis
+        zc_out (np.ndarray): (F,) output, z-coordinate of each face centroid
+        edges (np.ndarray): optional (F, 2, 3) scratch for the two face edge
+        vectors; callers that redraw every frame pass a preallocated buffer so
+        no per-call allocation happens
+        normals (np.ndarray): optional (F, 3) scratch for the face normals,
+        reusable afterwards for any other per-face geometry test
+    """
+    if edges is None:
+        edges = np.empty((faces.shape[0], 2, 3), dtype=vertices.dtype)
+    if normals is None:
+        normals = np.empty((faces.shape[0], 3), dtype=vertices.dtype)
+    # Normals only need the first three corners of each face
+    tri = vertices[faces[:, :3]]
+    e1, e2 = edges[:, 0], edges[:, 1]
+    np.subtract(tri[:, 1], tri[:, 0], out=e1)
+    np.subtract(tri[:, 2], tri[:, 1], out=e2)
+    # Cross product written component-wise into the scratch (np.cross has no out=)
+    normals[:, 0] = e1[:, 1] * e2[:, 2] - e1[:, 2] * e2[:, 1]
+    normals[:, 1] = e1[:, 2] * e2[:, 0] - e1[:, 0] * e2[:, 2]
+    normals[:, 2] = e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]
+    # No clipping needed: the normalized z-component is in [-1, 1] analytically,
+    # up to FP rounding, which the 256-level shade quantization absorbs
+    np.divide(normals[:, 2], np.linalg.norm(normals, axis=1), out=cos_out)
+    # Centroid depth only needs the z column: np.take gathers an (F, K) slice
+    # without materializing the full (F, K, 3) corner array
+    zc_out[:] = np.take(vertices[:, 2], faces).mean(axis=1)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _face_kernel(vertices, faces, cos_out, zc_out):
+        """
+        Compiled equivalent of `_face_batch`. The explicit loop lets LLVM keep the
+        3-element cross product and norm in registers, avoiding NumPy's ufunc
+        dispatch overhead on tiny arrays.
+        """
+        num_corners = faces.shape[1]
+        for f in range(faces.shape[0]):
+            v0 = vertices[faces[f, 0]]
+            v1 = vertices[faces[f, 1]]
+            v2 = vertices[faces[f, 2]]
+            e1x, e1y, e1z = v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2]
+            e2x, e2y, e2z = v2[0] - v1[0], v2[1] - v1[1], v2[2] - v1[2]
+            nx = e1y * e2z - e1z * e2y
+            ny = e1z * e2x - e1x * e2z
+            nz = e1x * e2y - e1y * e2x
+            inv_n = 1.0 / np.sqrt(nx * nx + ny * ny + nz * nz)
+            cos_out[f] = nz * inv_n
+            zc = 0.0
+            for k in range(num_corners):
+                zc += vertices[faces[f, k], 2]
+            zc_out[f] = zc / num_corners
+
+    @njit(cache=True, fastmath=True)
+    def _face_kernel_tri(vertices, faces, cos_out, zc_out):
+        """
+        Triangle-specialized variant of `_face_kernel`. With the vertex count
+        fixed at three, the centroid loop unrolls into straight-line code that
+        LLVM can vectorize without any per-face shape handling.
+        """
+        for f in range(faces.shape[0]):
+            v0 = vertices[faces[f, 0]]
+            v1 = vertices[faces[f, 1]]
+            v2 = vertices[faces[f, 2]]
+            e1x, e1y, e1z = v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2]
+            e2x, e2y, e2z = v2[0] - v1[0], v2[1] - v1[1], v2[2] - v1[2]
+            nx = e1y * e2z - e1z * e2y
+            ny = e1z * e2x - e1x * e2z
+            nz = e1x * e2y - e1y * e2x
+            inv_n = 1.0 / np.sqrt(nx * nx + ny * ny + nz * nz)
+            cos_out[f] = nz * inv_n
+            zc_out[f] = (v0[2] + v1[2] + v2[2]) / 3.0
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _face_kernel_par(vertices, faces, cos_out, zc_out):
+        """
+        Parallel variant of `_face_kernel` for large meshes -- faces are
+        independent, so the loop parallelizes across cores with prange.
+        """
+        num_corners = faces.shape[1]
+        for f in prange(faces.shape[0]):
+            v0 = vertices[faces[f, 0]]
+            v1 = vertices[faces[f, 1]]
+            v2 = vertices[faces[f, 2]]
+            e1x, e1y, e1z = v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2]
+            e2x, e2y, e2z = v2[0] - v1[0], v2[1] - v1[1], v2[2] - v1[2]
+            nx = e1y * e2z - e1z * e2y
+            ny = e1z * e2x - e1x * e2z
+            nz = e1x * e2y - e1y * e2x
+            inv_n = 1.0 / np.sqrt(nx * nx + ny * ny + nz * nz)
+            cos_out[f] = nz * inv_n
+            zc = 0.0
+            for k in range(num_corners):
+                zc += vertices[faces[f, k], 2]
+            zc_out[f] = zc / num_corners
+
+    # Warm up the JIT on a dummy face at import time so the first redraw does
+    # not stutter on compilation
+    _warmup_args = (
+        np.eye(3, dtype=np.float32),
+        np.array([[0, 1, 2]], dtype=np.int32),
+        np.empty(1),
+        np.empty(1),
+    )
+    # The parallel kernel is left to compile lazily: only meshes above the
+    # threshold ever reach it, and parallel compilation is noticeably slower
+    _face_kernel(*_warmup_args)
+    _face_kernel_tri(*_warmup_args)
+else:
+    _face_kernel = _face_batch
+    _face_kernel_tri = _face_batch
+    _face_kernel_par = _face_batch
+
 
 class Polyhedron:
     """
@@ -21,8 +159,20 @@ class Polyhedron:
         """
         self.num_vertices = 0
         self.num_faces = 0
-        self.vertices = np.array([])
+        self.vertices = np.empty((0, 3), dtype=np.float32)
         self.faces = []
+        self.faces_arr = np.empty((0, 3), dtype=np.int32)
+        self.face_orientation = np.empty(0)
+        # Accumulated model rotation. The base vertices are never mutated;
+        # rotations fold into this 3x3 matrix and are applied to the vertices in
+        # a single pass when world_vertices() is called at draw time
+        self.rotation = np.eye(3, dtype=np.float32)
+        # Scratch buffers reused by every rotation so that no per-call ndarray
+        # allocation happens during a drag
+        self._rotation_buf = np.empty((3, 3), dtype=np.float32)
+        self._rotation_acc = np.empty((3, 3), dtype=np.float32)
+        self._vertex_buf = np.empty((0, 3), dtype=np.float32)
+        self._rotation_count = 0
 
     def read_file(self, obj_text_file: str) -> None:
         """
@@ -36,20 +186,41 @@ class Polyhedron:
             first_line = f.readline().split(",")
             self.num_vertices = int(first_line[0])
             self.num_faces = int(first_line[1])
-            self.vertices = np.zeros((self.num_vertices, 3), dtype=float)
-            for _ in range(self.num_vertices):
-                id, x, y, z = f.readline().split(",")
-                # use (id-1) instead of id to change from 1-indexed to 0-indexed
-                self.vertices[int(id) - 1] = np.array([float(x), float(y), float(z)])
-            for _ in range(self.num_faces):
-                vertices = f.readline().split(",")
-                # use (id-1) instead of id to change from 1-indexed to 0-indexed
-                vertices = [int(v) - 1 for v in vertices]
-                self.faces.append(tuple(vertices))
+            # Parse the vertex and face blocks with loadtxt -- one C-level pass
+            # each, instead of a Python loop splitting and converting per line
+            vertex_rows = np.loadtxt(
+                f, delimiter=",", max_rows=self.num_vertices, ndmin=2
+            )
+            # use (id-1) instead of id to change from 1-indexed to 0-indexed
+            ids = vertex_rows[:, 0].astype(np.int64) - 1
+            # float32 is ample for screen-space precision and halves the memory
+            # streamed through every rotation matmul
+            self.vertices = np.empty((self.num_vertices, 3), dtype=np.float32)
+            self.vertices[ids] = vertex_rows[:, 1:]
+            # Contiguous (F, K) index array so drawing can gather all face vertices
+            # with one fancy-indexing operation. Assumes a uniform count per face.
+            self.faces_arr = (
+                np.loadtxt(f, delimiter=",", max_rows=self.num_faces,
+                           dtype=np.int32, ndmin=2)
+                - 1
+            )
+        self.faces = [tuple(int(v) for v in face) for face in self.faces_arr]
+        # Per-face orientation signs for back-face culling: +1 when the face
+        # winding yields a normal pointing away from the object centroid, -1 when
+        # it points inward. Input files do not guarantee consistent winding, and
+        # rotations preserve the signs, so they are computed once here.
+        corners = self.vertices[self.faces_arr]
+        normals = np.cross(
+            corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 1]
+        )
+        outward = corners.mean(axis=1) - self.vertices.mean(axis=0)
+        self.face_orientation = np.where((normals * outward).sum(axis=1) < 0, -1.0, 1.0)
 
     def calculate_centroid(self, face: list[float]) -> tuple:
         """
-        Function to calculate centroid of a face of the polyhedron.
+        Function to calculate centroid of a face of the polyhedron. Kept as a
+        utility -- the drawing path computes all face centroids in one batch
+        inside the face kernel instead of calling this per face.
 
         Args:
             face (tuple): Tuple of vertices of the face
@@ -69,54 +240,111 @@ class Polyhedron:
 
     def rotate_x(self, angle: float) -> None:
         """
-        Rotates the polyhedron object by a given angle around the x-axis, by applying
-        a rotation matrix to the vertices.
+        Rotates the polyhedron object by a given angle around the x-axis, by folding
+        a rotation matrix into the accumulated rotation.
 
         Args:
             angle (float): An integer representing the angle of rotation in degrees.
         """
-        rotation_matrix = np.array(
-            [
-                [1, 0, 0],
-                [0, np.cos(angle), -np.sin(angle)],
-                [0, np.sin(angle), np.cos(angle)],
-            ]
-        )
-        self.vertices = np.dot(self.vertices, rotation_matrix)
+        c, s = np.cos(angle), np.sin(angle)
+        rotation_matrix = self._rotation_buf
+        rotation_matrix[:] = 0
+        rotation_matrix[0, 0] = 1
+        rotation_matrix[1, 1] = rotation_matrix[2, 2] = c
+        rotation_matrix[1, 2] = -s
+        rotation_matrix[2, 1] = s
+        self._fold_rotation()
 
     def rotate_y(self, angle: float) -> None:
         """
-        Rotates the polyhedron object by a given angle around the y-axis, by applying
-        a rotation matrix to the vertices.
+        Rotates the polyhedron object by a given angle around the y-axis, by folding
+        a rotation matrix into the accumulated rotation.
 
         Args:
             angle (float): An integer representing the angle of rotation in degrees.
         """
-        rotation_matrix = np.array(
-            [
-                [np.cos(angle), 0, np.sin(angle)],
-                [0, 1, 0],
-                [-np.sin(angle), 0, np.cos(angle)],
-            ]
-        )
-        self.vertices = np.dot(self.vertices, rotation_matrix)
+        c, s = np.cos(angle), np.sin(angle)
+        rotation_matrix = self._rotation_buf
+        rotation_matrix[:] = 0
+        rotation_matrix[1, 1] = 1
+        rotation_matrix[0, 0] = rotation_matrix[2, 2] = c
+        rotation_matrix[0, 2] = s
+        rotation_matrix[2, 0] = -s
+        self._fold_rotation()
 
     def rotate_z(self, angle: float) -> None:
         """
-        Rotates the polyhedron object by a given angle around the z-axis, by applying
-        a rotation matrix to the vertices.
+        Rotates the polyhedron object by a given angle around the z-axis, by folding
+        a rotation matrix into the accumulated rotation.
 
         Args:
             angle (float): An integer representing the angle of rotation in degrees.
         """
-        rotation_matrix = np.array(
-            [
-                [np.cos(angle), -np.sin(angle), 0],
-                [np.sin(angle), np.cos(angle), 0],
-                [0, 0, 1],
-            ]
-        )
-        self.vertices = np.dot(self.vertices, rotation_matrix)
+        c, s = np.cos(angle), np.sin(angle)
+        rotation_matrix = self._rotation_buf
+        rotation_matrix[:] = 0
+        rotation_matrix[2, 2] = 1
+        rotation_matrix[0, 0] = rotation_matrix[1, 1] = c
+        rotation_matrix[0, 1] = -s
+        rotation_matrix[1, 0] = s
+        self._fold_rotation()
+
+    def rotate(self, angle_x: float, angle_y: float) -> None:
+        """
+        Rotates the polyhedron object around the x-axis and then the y-axis, by
+        folding the combined rotation matrix, built in closed form, into the
+        accumulated rotation. Equivalent to `rotate_x(angle_x)` followed by
+        `rotate_y(angle_y)` at half the cost.
+
+        Args:
+            angle_x (float): angle of rotation around the x-axis in radians.
+            angle_y (float): angle of rotation around the y-axis in radians.
+        """
+        cx, sx = np.cos(angle_x), np.sin(angle_x)
+        cy, sy = np.cos(angle_y), np.sin(angle_y)
+        # Closed form of Rx @ Ry, filled into the reusable buffer
+        rotation_matrix = self._rotation_buf
+        rotation_matrix[0, 0] = cy
+        rotation_matrix[0, 1] = 0
+        rotation_matrix[0, 2] = sy
+        rotation_matrix[1, 0] = sx * sy
+        rotation_matrix[1, 1] = cx
+        rotation_matrix[1, 2] = -sx * cy
+        rotation_matrix[2, 0] = -cx * sy
+        rotation_matrix[2, 1] = sx
+        rotation_matrix[2, 2] = cx * cy
+        self._fold_rotation()
+
+    def _fold_rotation(self) -> None:
+        """
+        Folds the rotation matrix currently held in the scratch buffer into the
+        accumulated rotation. The vertices are left untouched, so a motion event
+        costs a 3x3 matmul instead of a full pass over the vertex array; the
+        combined rotation is applied once per frame by `world_vertices`. The
+        accumulated matrix is re-orthogonalized periodically so floating-point
+        drift cannot compound over thousands of drag events.
+        """
+        np.matmul(self.rotation, self._rotation_buf, out=self._rotation_acc)
+        self.rotation, self._rotation_acc = self._rotation_acc, self.rotation
+        self._rotation_count += 1
+        if self._rotation_count >= 256:
+            u, _, vt = np.linalg.svd(self.rotation)
+            np.matmul(u, vt, out=self.rotation)
+            self._rotation_count = 0
+
+    def world_vertices(self) -> np.ndarray:
+        """
+        Returns the vertices with the accumulated rotation applied, written into
+        a reusable buffer -- one pass over the vertex array per call and no
+        allocation. The base vertices themselves are never mutated.
+
+        Returns:
+            np.ndarray: (V, 3) array of rotated vertex coordinates
+        """
+        if self._vertex_buf.shape != self.vertices.shape:
+            self._vertex_buf = np.empty_like(self.vertices)
+        np.matmul(self.vertices, self.rotation, out=self._vertex_buf)
+        return self._vertex_buf
 
 
 class Drawing:
@@ -126,7 +354,8 @@ class Drawing:
     from 3D points to 2D canvas, and drawing the 3D object on the canvas.
     """
 
-    def __init__(self, root: Tk, width: int, height: int) -> None:
+    def __init__(self, root: Tk, width: int, height: int,
+                 show_vertices: bool = False) -> None:
         """
         Initialize a Drawing object with a Tkinter root, a width and a height
 
@@ -134,14 +363,45 @@ class Drawing:
             root (Tk): Tk class instance
             width (int): width of the canvas in pixels
             height (int): height of the canvas in pixels
+            show_vertices (bool): whether to draw a marker at each visible vertex.
+            Off by default -- the polygon outlines already trace the vertices, and
+            the markers add one canvas item per vertex to every redraw
         """
         self.root = root
+        self.show_vertices = show_vertices
         self.canvas = Canvas(self.root, width=width, height=height, background="white")
         self.canvas.pack()
         self.root.update()
         self.distance = IntVar()
         self.origin = [self.canvas.winfo_width() / 2, self.canvas.winfo_height() / 2]
         self.start_x, self.start_y = 0, 0
+        # winfo_rgb crosses the Tk/Tcl boundary, so query the two shade endpoints
+        # once and precompute a lookup table of the 256 quantized shades between
+        # them; draw_polyhedron indexes it instead of formatting colors per face.
+        # Entry i holds the shade for |cos| = i / 255 between the surface normal
+        # and the z-axis -- the arcsin mapping of the original angle-based shade
+        # curve is baked in here, so the per-frame path never calls arccos
+        rgb_min = self.canvas.winfo_rgb("#00005F")
+        rgb_max = self.canvas.winfo_rgb("#0000FF")
+        ratios = np.arcsin(np.linspace(0, 1, 256)) / (np.pi / 2)
+        self._color_lut = [
+            "#%04x%04x%04x"
+            % tuple(int(lo + (hi - lo) * t) for lo, hi in zip(rgb_min, rgb_max))
+            for t in ratios
+        ]
+        # Persistent pools of canvas items, reused between redraws -- updating an
+        # existing item is far cheaper in Tk than deleting and recreating it
+        self._poly_ids = []
+        self._oval_ids = []
+        # Per-face geometry buffers, sized to the mesh on first draw and reused
+        # every frame so a redraw performs no per-face allocations
+        self._cos_buf = np.empty(0)
+        self._zc_buf = np.empty(0)
+        self._edges = np.empty((0, 2, 3), dtype=np.float32)
+        self._normals = np.empty((0, 3), dtype=np.float32)
+        # Mouse motion accumulated since the last redraw, flushed by after_idle
+        self._redraw_pending = False
+        self._accum_dx, self._accum_dy = 0, 0
         self.bind_mouse_actions()
 
     def project(self, vertex: np.array, scaling_factor: int) -> tuple:
@@ -185,52 +445,118 @@ class Drawing:
         - Place and shade the face from the furthest away face to the closest face
         to the user.
 
+        The normals, shades and centroids are computed for all faces by one call
+        into a compiled `numba` kernel (or an equivalent batch of NumPy operations
+        when `numba` is not installed) instead of one face at a time, so only the
+        Tkinter drawing calls remain per-face.
+
         Args:
             polyhedron (Polyhedron): Polyhedron object to be drawn
         """
         scaling_factor = self.origin[1] / 2  # object must fill half the window
         self.polyhedron = polyhedron
-        z_ordered_faces = []
-        r_min, g_min, b_min = self.canvas.winfo_rgb("#00005F")
-        r_max, g_max, b_max = self.canvas.winfo_rgb("#0000FF")
-
-        for face in polyhedron.faces:
-            # Find the surface normal using cross product
-            normal = np.cross(
-                self.polyhedron.vertices[face[1]] - self.polyhedron.vertices[face[0]],
-                self.polyhedron.vertices[face[2]] - self.polyhedron.vertices[face[1]],
-            )
-            normal = normal / np.linalg.norm(normal)
-            # Generate shade between #00005F and #0000FF, based on angle with z-axis
-            angle = np.dot(normal, np.array([0, 0, 1]))
-            angle = np.arccos(np.clip(angle, -1, 1))
-            if angle > np.pi / 2:  # clip angles to be between 0 and pi/2
-                angle = np.pi - angle
-            angle = np.pi / 2 - angle
-            r = int(r_min + (r_max - r_min) * angle / (np.pi / 2))
-            g = int(g_min + (g_max - g_min) * angle / (np.pi / 2))
-            b = int(b_min + (b_max - b_min) * angle / (np.pi / 2))
-            color = f"#{r:04x}{g:04x}{b:04x}"
-            z_centroid = self.polyhedron.calculate_centroid(face)[2]
-            z_ordered_faces.append((z_centroid, face, color))
-        # Sort the faces based on how close they are to the viewer
-        z_ordered_faces.sort(reverse=True)
-        for _, face, color in z_ordered_faces:
-            coords = [
-                self.project(polyhedron.vertices[vertex], scaling_factor)
-                for vertex in face
-            ]
-            for coord in coords:
-                self.canvas.create_oval(
-                    coord[0] - 5,
-                    coord[1] - 5,
-                    coord[0] + 5,
-                    coord[1] + 5,
-                    outline="blue",
-                    fill="blue",
-                    width=5,
+        # One pass applies the accumulated rotation to the base vertices
+        vertices = polyhedron.world_vertices()
+        # Surface normals (via cross products) and centroids for all faces in one
+        # kernel call. Taking |nz| folds angles into [0, pi/2] without branching.
+        if self._cos_buf.shape[0] != polyhedron.num_faces:
+            self._cos_buf = np.empty(polyhedron.num_faces)
+            self._zc_buf = np.empty(polyhedron.num_faces)
+        cos_a = self._cos_buf
+        z_centroids = self._zc_buf
+        # Large meshes go parallel across faces; below the threshold, triangle
+        # meshes get the specialized kernel with the centroid unrolled
+        if polyhedron.num_faces >= _PARALLEL_THRESHOLD:
+            kernel = _face_kernel_par
+        elif polyhedron.faces_arr.shape[1] == 3:
+            kernel = _face_kernel_tri
+        else:
+            kernel = _face_kernel
+        if kernel is _face_batch:
+            # the NumPy fallback keeps its edge and normal intermediates in
+            # buffers owned here, reused across frames
+            if self._edges.shape[0] != polyhedron.num_faces:
+                self._edges = np.empty(
+                    (polyhedron.num_faces, 2, 3), dtype=vertices.dtype
+                )
+                self._normals = np.empty(
+                    (polyhedron.num_faces, 3), dtype=vertices.dtype
+                )
+            kernel(vertices, polyhedron.faces_arr, cos_a, z_centroids,
+                   self._edges, self._normals)
+        else:
+            kernel(vertices, polyhedron.faces_arr, cos_a, z_centroids)
+        # Back-face culling: the painter's order draws faces from largest to
+        # smallest z-centroid, so the surface the viewer ends up seeing is the
+        # smallest-z side -- i.e. the faces whose outward normal has a negative
+        # z-component. The others are overdrawn anyway (assuming a roughly convex
+        # object), so skip shading and drawing them. Edge-on faces project to
+        # zero area and are skipped too.
+        visible = np.nonzero(cos_a * polyhedron.face_orientation < 0)[0]
+        cos_a = np.abs(cos_a[visible])
+        z_centroids = z_centroids[visible]
+        # Generate shades between #00005F and #0000FF, based on angle with z-axis:
+        # the angle-to-shade curve lives in the precomputed color table, so the
+        # quantized |cos| is the table index and no arccos is evaluated here
+        shade_idx = (cos_a * 255).astype(np.uint8)
+        # Project every vertex onto the 2D canvas in one operation; the face and
+        # vertex-marker loops below just index into the result
+        projected = np.asarray(self.origin) + vertices[:, :2] * scaling_factor
+        # Flatten and convert the polygon coordinates for the whole batch in one
+        # pass -- each row is the flat (x0, y0, x1, y1, ...) argument list that
+        # Tk expects, ready to unpack without per-face ravel/tolist calls
+        face_coords = (
+            projected[polyhedron.faces_arr[visible]].reshape(len(visible), -1).tolist()
+        )
+        # Sort the faces based on how close they are to the viewer. A stable sort
+        # keeps faces with equal depth in a fixed order, so the stacking of
+        # coplanar faces cannot flicker between frames
+        order = np.argsort(-z_centroids, kind="stable")
+        used = 0
+        for i in order:
+            color = self._color_lut[shade_idx[i]]
+            coords = face_coords[i]
+            if used < len(self._poly_ids):
+                item = self._poly_ids[used]
+                self.canvas.coords(item, *coords)
+                self.canvas.itemconfig(item, fill=color, outline=color, state="normal")
+                # updated items keep their old stacking position, so re-raise each
+                # one in back-to-front order to restore the painter's ordering
+                self.canvas.tag_raise(item)
+            else:
+                self._poly_ids.append(
+                    self.canvas.create_polygon(*coords, fill=color, outline=color, width=2)
+                )
+            used += 1
+        for item in self._poly_ids[used:]:
+            self.canvas.itemconfig(item, state="hidden")
+        # Draw each vertex marker once, instead of once per face corner -- vertices
+        # are shared between faces, and only those on a visible face get a marker
+        if not self.show_vertices:
+            return
+        used = 0
+        for vertex in np.unique(polyhedron.faces_arr[visible]):
+            x, y = projected[vertex]
+            if used < len(self._oval_ids):
+                item = self._oval_ids[used]
+                self.canvas.coords(item, x - 5, y - 5, x + 5, y + 5)
+                self.canvas.itemconfig(item, state="normal")
+                self.canvas.tag_raise(item)
+            else:
+                self._oval_ids.append(
+                    self.canvas.create_oval(
+                        x - 5,
+                        y - 5,
+                        x + 5,
+                        y + 5,
+                        outline="blue",
+                        fill="blue",
+                        width=5,
+                    )
                 )
-            self.canvas.create_polygon(coords, fill=color, outline=color, width=2)
+            used += 1
+        for item in self._oval_ids[used:]:
+            self.canvas.itemconfig(item, state="hidden")
 
     def bind_mouse_actions(self) -> None:
         """
@@ -251,18 +577,32 @@ class Drawing:
 
     def mouse_drag(self, event: Event) -> None:
         """
-        Event triggered on drag
+        Event triggered on drag. Only accumulates the mouse motion and schedules
+        one redraw via `after_idle` if none is pending -- Tk can deliver motion
+        events faster than frames can be drawn, and this coalesces them into a
+        single rotation and redraw.
 
         Args:
             event (Event): Tkinter Event Object
         """
         x, y = event.x, event.y
-        dx, dy = self.start_x - x, self.start_y - y
-        self.polyhedron.rotate_x(dy * 0.001)
-        self.polyhedron.rotate_y(-dx * 0.001)
-        self.canvas.delete("all")
-        self.draw_polyhedron(self.polyhedron)
+        self._accum_dx += self.start_x - x
+        self._accum_dy += self.start_y - y
         self.start_x, self.start_y = x, y
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
+        """
+        Apply the mouse motion accumulated since the last redraw as one fused
+        rotation, and redraw the polyhedron once.
+        """
+        dx, dy = self._accum_dx, self._accum_dy
+        self._accum_dx, self._accum_dy = 0, 0
+        self._redraw_pending = False
+        self.polyhedron.rotate(dy * 0.001, -dx * 0.001)
+        self.draw_polyhedron(self.polyhedron)
 
 
 def main():
@@ -272,6 +612,11 @@ def main():
     # read the input file
     parser = argparse.ArgumentParser(description="Polyhedron Visualization")
     parser.add_argument("obj_filename", type=str, help="Sample object file name")
+    parser.add_argument(
+        "--vertices",
+        action="store_true",
+        help="Draw a marker at each visible vertex",
+    )
     args = parser.parse_args()
     # instantiate polyhedron
     polyhedron = Polyhedron()
@@ -281,7 +626,7 @@ def main():
     height = root.winfo_screenheight()
     width = root.winfo_screenwidth()
     # Set up Tkinter Drawing
-    drawing = Drawing(root, width, height)
+    drawing = Drawing(root, width, height, show_vertices=args.vertices)
     drawing.draw_polyhedron(polyhedron)
     root.title("Polyhedron Visualization")
     root.mainloop()